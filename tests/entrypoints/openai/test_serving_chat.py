@@ -8,7 +8,8 @@ from unittest.mock import MagicMock
 
 from vllm.config import MultiModalConfig
 from vllm.engine.multiprocessing.client import MQLLMEngineClient
-from vllm.entrypoints.openai.protocol import ChatCompletionRequest
+from vllm.entrypoints.openai.protocol import (ChatCompletionRequest,
+                                              DeltaMessage)
 from vllm.entrypoints.openai.serving_chat import OpenAIServingChat
 from vllm.entrypoints.openai.serving_models import (BaseModelPath,
                                                     OpenAIServingModels)
@@ -272,3 +273,40 @@ def test_serving_chat_could_load_correct_generation_config():
 
     assert mock_engine.generate.call_args.args[1].temperature == 0.0
     assert mock_engine.generate.call_args.args[1].repetition_penalty == 1.05
+
+
+def test_append_held_back_delta():
+    append_held_back_delta = OpenAIServingChat._append_held_back_delta
+
+    # Nothing held back by the reasoning parser
+    delta_message = DeltaMessage(content="abc")
+    assert append_held_back_delta(delta_message, None) is delta_message
+    assert append_held_back_delta(None, None) is None
+
+    # The last output produced no delta, e.g. it was held back as well
+    held_back_message = DeltaMessage.model_construct(content="◁th")
+    assert append_held_back_delta(None, held_back_message) is held_back_message
+
+    # Held back text is appended to the same field of the last delta
+    delta_message = append_held_back_delta(
+        DeltaMessage(reasoning_content="abc"),
+        DeltaMessage.model_construct(reasoning_content="◁/th"))
+    assert delta_message.reasoning_content == "abc◁/th"
+    assert delta_message.content is None
+
+    delta_message = append_held_back_delta(
+        DeltaMessage(content="abc"),
+        DeltaMessage.model_construct(content="◁th"))
+    assert delta_message.content == "abc◁th"
+    assert delta_message.reasoning_content is None
+
+    # A field the last delta didn't set is still sent with the chunk
+    delta_message = append_held_back_delta(
+        DeltaMessage(content="abc"),
+        DeltaMessage.model_construct(reasoning_content="◁"))
+    assert delta_message.content == "abc"
+    assert delta_message.reasoning_content == "◁"
+    assert delta_message.model_dump(exclude_unset=True) == {
+        "content": "abc",
+        "reasoning_content": "◁",
+    }
@@ -0,0 +1,241 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from itertools import zip_longest
+
+import pytest
+from transformers import AutoTokenizer
+
+from tests.reasoning.utils import (StreamingReasoningReconstructor,
+                                   run_reasoning_extraction)
+from vllm.reasoning import ReasoningParser, ReasoningParserManager
+
+parser_names = ["kimi", "kimi2", "kimi3"]
+start_token = "◁think▷"
+end_token = "◁/think▷"
+
+# The Kimi parsers are text-based, so any tokenizer works here.
+REASONING_MODEL_NAME = "deepseek-ai/DeepSeek-R1-Distill-Qwen-1.5B"
+
+
+@pytest.fixture(scope="module")
+def kimi_tokenizer():
+    return AutoTokenizer.from_pretrained(REASONING_MODEL_NAME)
+
+
+# Each case lists the deltas the parser sees when streaming; the
+# non-streaming parser sees them joined together.
+SIMPLE_REASONING = {
+    "deltas": [
+        start_token, "This is a reasoning section", end_token,
+        "This is the rest"
+    ],
+    "reasoning_content":
+    "This is a reasoning section",
+    "content":
+    "This is the rest",
+}
+COMPLETE_REASONING = {
+    "deltas": [start_token, "This is a reasoning section", end_token],
+    "reasoning_content": "This is a reasoning section",
+    "content": None,
+}
+NO_END_TOKEN = {
+    "deltas": [start_token, "This is a reasoning section"],
+    "reasoning_content": "This is a reasoning section",
+    "content": None,
+}
+MULTIPLE_LINES = {
+    "deltas": [start_token, "This\nThat", end_token, "This is the rest\nThat"],
+    "reasoning_content": "This\nThat",
+    "content": "This is the rest\nThat",
+}
+SPLIT_TOKENS = {
+    "deltas": [
+        "◁thi", "nk▷This is a ", "reasoning section◁/th", "ink▷",
+        "This is the rest"
+    ],
+    "reasoning_content":
+    "This is a reasoning section",
+    "content":
+    "This is the rest",
+}
+START_TOKEN_SPLIT_BEFORE_LAST_CHARACTER = {
+    "deltas":
+    ["◁think", "▷This is a reasoning section", end_token, "This is the rest"],
+    "reasoning_content":
+    "This is a reasoning section",
+    "content":
+    "This is the rest",
+}
+END_TOKEN_SPLIT_BEFORE_LAST_CHARACTER = {
+    "deltas": [
+        start_token, "This is a reasoning section◁/think", "▷",
+        "This is the rest"
+    ],
+    "reasoning_content":
+    "This is a reasoning section",
+    "content":
+    "This is the rest",
+}
+CHARACTER_DELTAS = {
+    "deltas": list(f"{start_token}abc{end_token}"),
+    "reasoning_content": "abc",
+    "content": None,
+}
+FALSE_END_TOKEN = {
+    "deltas": [start_token, "This is ◁/thin", "g", end_token, "The rest"],
+    "reasoning_content": "This is ◁/thing",
+    "content": "The rest",
+}
+MULTIPLE_END_TOKENS = {
+    "deltas": [start_token, "a", end_token, "b", end_token, "c"],
+    "reasoning_content": "a",
+    "content": f"b{end_token}c",
+}
+END_TOKEN_PREFIX_AT_END = {
+    "deltas": [start_token, "This is a reasoning section◁/th"],
+    "reasoning_content": "This is a reasoning section◁/th",
+    "content": None,
+}
+END_TOKEN_LEAD_AT_END = {
+    "deltas": [start_token, "This is a reasoning section◁"],
+    "reasoning_content": "This is a reasoning section◁",
+    "content": None,
+}
+NO_START_TOKEN = {
+    "deltas": ["This is a reasoning section", end_token, "This is the rest"],
+    "reasoning_content": None,
+    "content": f"This is a reasoning section{end_token}This is the rest",
+}
+# Without a leading ◁think▷, the lenient parsers still treat everything up to
+# a bare ◁/think▷ as reasoning when streaming.
+NO_START_TOKEN_LENIENT_STREAMING = {
+    "deltas": ["This is a reasoning section", end_token, "This is the rest"],
+    "reasoning_content": "This is a reasoning section",
+    "content": "This is the rest",
+}
+START_TOKEN_PREFIX_ONLY = {
+    "deltas": ["◁th"],
+    "reasoning_content": None,
+    "content": "◁th",
+}
+START_TOKEN_PREFIX_ONLY_LENIENT_STREAMING = {
+    "deltas": ["◁th"],
+    "reasoning_content": "◁th",
+    "content": None,
+}
+
+TEST_CASES = [
+    pytest.param(True, SIMPLE_REASONING, id="simple_reasoning_streaming"),
+    pytest.param(False, SIMPLE_REASONING, id="simple_reasoning"),
+    pytest.param(True, COMPLETE_REASONING, id="complete_reasoning_streaming"),
+    pytest.param(False, COMPLETE_REASONING, id="complete_reasoning"),
+    pytest.param(True, NO_END_TOKEN, id="no_end_token_streaming"),
+    pytest.param(False, NO_END_TOKEN, id="no_end_token"),
+    pytest.param(True, MULTIPLE_LINES, id="multiple_lines_streaming"),
+    pytest.param(False, MULTIPLE_LINES, id="multiple_lines"),
+    pytest.param(True, SPLIT_TOKENS, id="split_tokens_streaming"),
+    pytest.param(False, SPLIT_TOKENS, id="split_tokens"),
+    pytest.param(True,
+                 START_TOKEN_SPLIT_BEFORE_LAST_CHARACTER,
+                 id="start_token_split_before_last_character_streaming"),
+    pytest.param(False,
+                 START_TOKEN_SPLIT_BEFORE_LAST_CHARACTER,
+                 id="start_token_split_before_last_character"),
+    pytest.param(True,
+                 END_TOKEN_SPLIT_BEFORE_LAST_CHARACTER,
+                 id="end_token_split_before_last_character_streaming"),
+    pytest.param(False,
+                 END_TOKEN_SPLIT_BEFORE_LAST_CHARACTER,
+                 id="end_token_split_before_last_character"),
+    pytest.param(True, CHARACTER_DELTAS, id="character_deltas_streaming"),
+    pytest.param(False, CHARACTER_DELTAS, id="character_deltas"),
+    pytest.param(True, FALSE_END_TOKEN, id="false_end_token_streaming"),
+    pytest.param(False, FALSE_END_TOKEN, id="false_end_token"),
+    pytest.param(True, MULTIPLE_END_TOKENS,
+                 id="multiple_end_tokens_streaming"),
+    pytest.param(False, MULTIPLE_END_TOKENS, id="multiple_end_tokens"),
+    pytest.param(True,
+                 END_TOKEN_PREFIX_AT_END,
+                 id="end_token_prefix_at_end_streaming"),
+    pytest.param(False, END_TOKEN_PREFIX_AT_END, id="end_token_prefix_at_end"),
+    pytest.param(True,
+                 END_TOKEN_LEAD_AT_END,
+                 id="end_token_lead_at_end_streaming"),
+    pytest.param(False, END_TOKEN_LEAD_AT_END, id="end_token_lead_at_end"),
+    pytest.param(False, NO_START_TOKEN, id="no_start_token"),
+    pytest.param(False, START_TOKEN_PREFIX_ONLY, id="start_token_prefix_only"),
+]
+
+
+@pytest.mark.parametrize("parser_name", parser_names)
+@pytest.mark.parametrize("streaming, param_dict", TEST_CASES)
+def test_reasoning(
+    parser_name: str,
+    streaming: bool,
+    param_dict: dict,
+    kimi_tokenizer,
+):
+    parser: ReasoningParser = ReasoningParserManager.get_reasoning_parser(
+        parser_name)(kimi_tokenizer)
+
+    reasoning, content = run_reasoning_extraction(parser,
+                                                  param_dict["deltas"],
+                                                  streaming=streaming)
+
+    assert reasoning == param_dict["reasoning_content"]
+    assert content == param_dict["content"]
+
+
+@pytest.mark.parametrize("parser_name, param_dict", [
+    ("kimi", NO_START_TOKEN_LENIENT_STREAMING),
+    ("kimi2", NO_START_TOKEN_LENIENT_STREAMING),
+    ("kimi3", NO_START_TOKEN),
+    ("kimi", START_TOKEN_PREFIX_ONLY_LENIENT_STREAMING),
+    ("kimi2", START_TOKEN_PREFIX_ONLY_LENIENT_STREAMING),
+    ("kimi3", START_TOKEN_PREFIX_ONLY),
+])
+def test_no_start_token_streaming(
+    parser_name: str,
+    param_dict: dict,
+    kimi_tokenizer,
+):
+    parser: ReasoningParser = ReasoningParserManager.get_reasoning_parser(
+        parser_name)(kimi_tokenizer)
+
+    reasoning, content = run_reasoning_extraction(parser,
+                                                  param_dict["deltas"],
+                                                  streaming=True)
+
+    assert reasoning == param_dict["reasoning_content"]
+    assert content == param_dict["content"]
+
+
+@pytest.mark.parametrize("parser_name", parser_names)
+def test_interleaved_streams(parser_name: str, kimi_tokenizer):
+    # Every choice of a request with n > 1 gets its own parser, so a tag held
+    # back in one stream must never leak into another.
+    parser_cls = ReasoningParserManager.get_reasoning_parser(parser_name)
+    streams = [
+        [start_token, "abc◁/th", "ink▷", "xyz"],
+        [start_token, "Hello", end_token, "world"],
+    ]
+    parsers = [parser_cls(kimi_tokenizer) for _ in streams]
+    reconstructors = [StreamingReasoningReconstructor() for _ in streams]
+    previous_texts = [""] * len(streams)
+
+    for deltas in zip_longest(*streams):
+        for i, delta in enumerate(deltas):
+            if delta is None:
+                continue
+            current_text = previous_texts[i] + delta
+            delta_message = parsers[i].extract_reasoning_content_streaming(
+                previous_texts[i], current_text, delta, [], [], [])
+            if delta_message is not None:
+                reconstructors[i].append_delta(delta_message)
+            previous_texts[i] = current_text
+
+    assert reconstructors[0].reasoning_content == "abc"
+    assert reconstructors[0].other_content == "xyz"
+    assert reconstructors[1].reasoning_content == "Hello"
+    assert reconstructors[1].other_content == "world"
@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import importlib
+import sys
+
+import pytest
+
+import vllm.reasoning
+from vllm.reasoning import ReasoningParser, ReasoningParserManager
+
+BUILTIN_PARSERS = [
+    ("deepseek_r1", "vllm.reasoning.deepseek_r1_reasoning_parser",
+     "DeepSeekR1ReasoningParser"),
+    ("granite", "vllm.reasoning.granite_reasoning_parser",
+     "GraniteReasoningParser"),
+    ("kimi", "vllm.reasoning.kimi_reasoning_parser", "KimiReasoningParser"),
+    ("kimi2", "vllm.reasoning.kimi_reasoning_parser", "Kimi2ReasoningParser"),
+    ("kimi3", "vllm.reasoning.kimi_reasoning_parser", "Kimi3ReasoningParser"),
+]
+
+
+class PluginReasoningParser(ReasoningParser):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    # The registries are class attributes shared by the whole session, so
+    # every test starts from the built-in parsers, none of them resolved yet,
+    # and the real registries are put back afterwards.
+    monkeypatch.setattr(ReasoningParserManager, "reasoning_parsers", {})
+    monkeypatch.setattr(
+        ReasoningParserManager, "lazy_reasoning_parsers", {
+            name: (module_path, class_name)
+            for name, module_path, class_name in BUILTIN_PARSERS
+        })
+
+
+def test_register_lazy_module():
+    ReasoningParserManager.register_lazy_module(
+        "lazy_kimi", "vllm.reasoning.kimi_reasoning_parser",
+        "Kimi3ReasoningParser")
+    assert "lazy_kimi" in ReasoningParserManager.lazy_reasoning_parsers
+    assert "lazy_kimi" not in ReasoningParserManager.reasoning_parsers
+
+    parser_cls = ReasoningParserManager.get_reasoning_parser("lazy_kimi")
+
+    assert parser_cls is vllm.reasoning.Kimi3ReasoningParser
+    assert ReasoningParserManager.reasoning_parsers["lazy_kimi"] is parser_cls
+    assert "lazy_kimi" not in ReasoningParserManager.lazy_reasoning_parsers
+
+
+def test_list_registered():
+    ReasoningParserManager.register_lazy_module(
+        "lazy_kimi", "vllm.reasoning.kimi_reasoning_parser",
+        "KimiReasoningParser")
+    ReasoningParserManager.register_module("plugin",
+                                           module=PluginReasoningParser)
+
+    registered = ReasoningParserManager.list_registered()
+
+    # Lazy names are listed before they are imported
+    for name, _, _ in BUILTIN_PARSERS:
+        assert name in registered
+    assert "lazy_kimi" in registered
+    assert "plugin" in registered
+    assert len(registered) == len(set(registered))
+
+    ReasoningParserManager.get_reasoning_parser("lazy_kimi")
+    assert ReasoningParserManager.list_registered().count("lazy_kimi") == 1
+
+
+@pytest.mark.parametrize("name, module_path, class_name", BUILTIN_PARSERS)
+def test_get_reasoning_parser_lazy(name: str, module_path: str,
+                                   class_name: str):
+    assert name not in ReasoningParserManager.reasoning_parsers
+
+    parser_cls = ReasoningParserManager.get_reasoning_parser(name)
+
+    assert parser_cls is getattr(importlib.import_module(module_path),
+                                 class_name)
+    assert parser_cls is getattr(vllm.reasoning, class_name)
+    assert name not in ReasoningParserManager.lazy_reasoning_parsers
+
+
+def test_unknown_name():
+    with pytest.raises(KeyError):
+        ReasoningParserManager.get_reasoning_parser("no_such_parser")
+    with pytest.raises(AttributeError):
+        vllm.reasoning.NoSuchReasoningParser  # noqa: B018
+
+
+def test_module_getattr_reexport():
+    from vllm.reasoning import KimiReasoningParser, kimi_reasoning_parser
+
+    assert KimiReasoningParser is kimi_reasoning_parser.KimiReasoningParser
+    assert issubclass(KimiReasoningParser, ReasoningParser)
+
+
+def test_eager_registration_not_replaced(monkeypatch):
+    # Import the module that defines the built-in kimi2 parser afresh below;
+    # the module already loaded in this session is put back afterwards.
+    module_path = "vllm.reasoning.kimi_reasoning_parser"
+    monkeypatch.delitem(sys.modules, module_path, raising=False)
+    monkeypatch.delattr(vllm.reasoning, "kimi_reasoning_parser", raising=False)
+
+    ReasoningParserManager.register_module("kimi2",
+                                           module=PluginReasoningParser)
+    assert "kimi2" not in ReasoningParserManager.lazy_reasoning_parsers
+
+    # Resolve the sibling names and import the built-in kimi2 parser
+    ReasoningParserManager.get_reasoning_parser("kimi")
+    ReasoningParserManager.get_reasoning_parser("kimi3")
+    from vllm.reasoning import Kimi2ReasoningParser
+    assert module_path in sys.modules
+    assert Kimi2ReasoningParser is not PluginReasoningParser
+
+    assert ReasoningParserManager.get_reasoning_parser(
+        "kimi2") is PluginReasoningParser
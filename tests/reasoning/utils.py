@@ -92,4 +92,7 @@ def run_reasoning_extraction_streaming(
             reconstructor.append_delta(delta_message)
         previous_text = current_text
         previous_tokens = current_tokens
+    delta_message = reasoning_parser.finish_reasoning_content_streaming()
+    if delta_message is not None:
+        reconstructor.append_delta(delta_message)
     return reconstructor
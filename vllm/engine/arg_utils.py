@@ -495,7 +495,7 @@ class EngineArgs:
         guided_decoding_group.add_argument(
             "--reasoning-parser",
             # This choices is a special case because it's not static
-            choices=list(ReasoningParserManager.reasoning_parsers),
+            choices=ReasoningParserManager.list_registered(),
             **guided_decoding_kwargs["reasoning_backend"])
 
         parser.add_argument(
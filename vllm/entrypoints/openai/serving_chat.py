@@ -452,7 +452,14 @@ class OpenAIServingChat(OpenAIServing):
             # but the pre-commit hook requires it.
             if should_stream_with_reasoning_parsing and \
                 self.reasoning_parser is not None:
-                reasoning_parser = self.reasoning_parser(tokenizer)
+                # Reasoning parsers may keep state between deltas, so every
+                # choice gets its own instance.
+                reasoning_parsers: list[Optional[ReasoningParser]] = [
+                    self.reasoning_parser(tokenizer)
+                    for _ in range(num_choices)
+                ]
+            else:
+                reasoning_parsers = [None] * num_choices
         except RuntimeError as e:
             logger.exception("Error in reasoning parser creation.")
             data = self.create_streaming_error_response(str(e))
@@ -564,6 +571,7 @@ class OpenAIServingChat(OpenAIServing):
                 for output in res.outputs:
                     i = output.index
                     tool_parser = tool_parsers[i]
+                    reasoning_parser = reasoning_parsers[i]
 
                     if finish_reason_sent[i]:
                         continue
@@ -604,9 +612,9 @@ class OpenAIServingChat(OpenAIServing):
                     # handle streaming deltas for tools with named tool_choice
                     if tool_choice_function_name:
                         if (self.enable_reasoning
+                                and reasoning_parser is not None
                                 and not reasoning_parser.is_reasoning_end(
                                     previous_token_ids)):
-                            assert reasoning_parser is not None
                             delta_message = (
                                 reasoning_parser.
                                 extract_reasoning_content_streaming(
@@ -743,6 +751,16 @@ class OpenAIServingChat(OpenAIServing):
                     else:
                         delta_message = DeltaMessage(content=delta_text)
 
+                    # the reasoning parser may still hold back text (e.g. a
+                    # possible partial tag) that has to go out with the last
+                    # delta of the choice
+                    if (output.finish_reason is not None
+                            and reasoning_parser is not None):
+                        delta_message = self._append_held_back_delta(
+                            delta_message,
+                            reasoning_parser.
+                            finish_reasoning_content_streaming())
+
                     # update the previous values for the next iteration
                     if tool_choice_auto or should_stream_with_reasoning_parsing:
                         assert previous_texts is not None
@@ -1187,6 +1205,28 @@ class OpenAIServingChat(OpenAIServing):
             """
         return self.enable_reasoning and self.reasoning_parser is not None
 
+    @staticmethod
+    def _append_held_back_delta(
+        delta_message: Optional[DeltaMessage],
+        held_back_message: Optional[DeltaMessage],
+    ) -> Optional[DeltaMessage]:
+        """
+        Append the text a reasoning parser held back until the end of the
+        stream to the last delta of the choice.
+        """
+        if held_back_message is None:
+            return delta_message
+        if delta_message is None:
+            return held_back_message
+        if held_back_message.reasoning_content is not None:
+            delta_message.reasoning_content = (
+                (delta_message.reasoning_content or "") +
+                held_back_message.reasoning_content)
+        if held_back_message.content is not None:
+            delta_message.content = ((delta_message.content or "") +
+                                     held_back_message.content)
+        return delta_message
+
     def _should_check_for_unstreamed_tool_arg_tokens(
         self,
         delta_message: Optional[DeltaMessage],
@@ -1,11 +1,27 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import importlib
+
 from .abs_reasoning_parsers import ReasoningParser, ReasoningParserManager
-from .deepseek_r1_reasoning_parser import DeepSeekR1ReasoningParser
-from .granite_reasoning_parser import GraniteReasoningParser
-from .kimi_reasoning_parser import KimiReasoningParser
-from .kimi2_reasoning_parser import Kimi2ReasoningParser
-from .kimi3_reasoning_parser import Kimi3ReasoningParser
+
+# Built-in reasoning parsers, as name -> (module, class name). They are
+# imported on first use rather than with this package, and this table is
+# their only registration, so importing a parser module never replaces a
+# parser registered under the same name by a plugin.
+_REASONING_PARSERS_TO_REGISTER = {
+    "deepseek_r1":
+    ("deepseek_r1_reasoning_parser", "DeepSeekR1ReasoningParser"),
+    "granite": ("granite_reasoning_parser", "GraniteReasoningParser"),
+    "kimi": ("kimi_reasoning_parser", "KimiReasoningParser"),
+    "kimi2": ("kimi_reasoning_parser", "Kimi2ReasoningParser"),
+    "kimi3": ("kimi_reasoning_parser", "Kimi3ReasoningParser"),
+}
+
+for _name, (_module_name,
+            _class_name) in _REASONING_PARSERS_TO_REGISTER.items():
+    ReasoningParserManager.register_lazy_module(_name,
+                                                f"{__name__}.{_module_name}",
+                                                _class_name)
 
 __all__ = [
     "ReasoningParser",
@@ -16,3 +32,13 @@ __all__ = [
     "Kimi2ReasoningParser",
     "Kimi3ReasoningParser",
 ]
+
+
+def __getattr__(name: str):
+    # Keep `from vllm.reasoning import KimiReasoningParser` etc. working
+    # without importing every parser module up front.
+    for module_name, class_name in _REASONING_PARSERS_TO_REGISTER.values():
+        if name == class_name:
+            module = importlib.import_module(f".{module_name}", __name__)
+            return getattr(module, class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
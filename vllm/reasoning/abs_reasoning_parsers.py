@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import importlib
 import os
 from abc import abstractmethod
 from collections.abc import Sequence
@@ -101,23 +102,67 @@ class ReasoningParser:
         previously been parsed and extracted (see constructor)
         """
 
+    def finish_reasoning_content_streaming(self) -> Union[DeltaMessage, None]:
+        """
+        Called once the last delta of a stream has been passed to
+        `extract_reasoning_content_streaming`. Parsers that hold back text
+        between deltas (e.g. a possible partial tag) return it here so it
+        isn't lost when the stream ends. By default nothing is held back.
+        """
+        return None
+
 
 class ReasoningParserManager:
     reasoning_parsers: dict[str, type] = {}
+    # name -> (module path, class name), imported on first lookup
+    lazy_reasoning_parsers: dict[str, tuple[str, str]] = {}
 
     @classmethod
     def get_reasoning_parser(cls, name) -> type:
         """
-        Get reasoning parser by name which is registered by `register_module`.
+        Get reasoning parser by name which is registered by `register_module`
+        or `register_lazy_module`.
 
         Raise a KeyError exception if the name is not registered.
         """
         if name in cls.reasoning_parsers:
             return cls.reasoning_parsers[name]
 
+        if name in cls.lazy_reasoning_parsers:
+            # Names registered with `register_module` were already returned
+            # above, so a lazy entry never replaces them. Registering the
+            # class also drops the resolved lazy entry.
+            module_path, class_name = cls.lazy_reasoning_parsers[name]
+            module = importlib.import_module(module_path)
+            cls._register_module(module=getattr(module, class_name),
+                                 module_name=name,
+                                 force=False)
+            return cls.reasoning_parsers[name]
+
         raise KeyError(
             f"reasoning helper: '{name}' not found in reasoning_parsers")
 
+    @classmethod
+    def list_registered(cls) -> list[str]:
+        """
+        Get the names of all registered reasoning parsers, including the
+        ones that haven't been imported yet.
+        """
+        return list(
+            dict.fromkeys(
+                [*cls.reasoning_parsers, *cls.lazy_reasoning_parsers]))
+
+    @classmethod
+    def register_lazy_module(cls, name: str, module_path: str,
+                             class_name: str) -> None:
+        """
+        Register a reasoning parser that is only imported from `module_path`
+        the first time `name` is looked up, so processes that never use it
+        don't pay for importing it. A parser registered under the same name
+        with `register_module` always takes precedence.
+        """
+        cls.lazy_reasoning_parsers[name] = (module_path, class_name)
+
     @classmethod
     def _register_module(
         cls,
@@ -138,6 +183,8 @@ class ReasoningParserManager:
                 raise KeyError(f"{name} is already registered "
                                f"at {existed_module.__module__}")
             cls.reasoning_parsers[name] = module
+            # An explicit registration takes precedence over a lazy one.
+            cls.lazy_reasoning_parsers.pop(name, None)
 
     @classmethod
     def register_module(
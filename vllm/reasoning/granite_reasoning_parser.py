@@ -9,12 +9,20 @@ from transformers import PreTrainedTokenizerBase
 from vllm.entrypoints.openai.protocol import (ChatCompletionRequest,
                                               DeltaMessage)
 from vllm.logger import init_logger
-from vllm.reasoning import ReasoningParser, ReasoningParserManager
+from vllm.reasoning import ReasoningParser
 
 logger = init_logger(__name__)
 
+# NOTE: There have been some observed occurrences of quantized instances of
+# the current models using "Here's" instead of "Here is", so to be safe, we
+# match on both.
+_THINK_START_EXPR = r"(?:Here's|Here is) my thought process:"
+_RESPONSE_START_EXPR = r"(?:Here's|Here is) my response:"
+
+_REASONING_REGEX = re.compile(
+    rf"{_THINK_START_EXPR}(.*?){_RESPONSE_START_EXPR}(.*)", re.DOTALL)
+
 
-@ReasoningParserManager.register_module("granite")
 class GraniteReasoningParser(ReasoningParser):
     """
     Reasoning parser for IBM Granite.
@@ -26,16 +34,6 @@ class GraniteReasoningParser(ReasoningParser):
     def __init__(self, tokenizer: PreTrainedTokenizerBase):
         super().__init__(tokenizer)
 
-        # NOTE: There have been some observed occurrences of quantized
-        # instances of the current models using "Here's" instead of "Here is",
-        # so to be safe, we match on both.
-        self.think_start_expr = r"(?:Here's|Here is) my thought process:"
-        self.response_start_expr = r"(?:Here's|Here is) my response:"
-
-        self.reasoning_regex = re.compile(
-            rf"{self.think_start_expr}(.*?){self.response_start_expr}(.*)",
-            re.DOTALL)
-
         self.valid_think_starts = [
             "Here's my thought process:", "Here is my thought process:"
         ]
@@ -66,10 +64,10 @@ class GraniteReasoningParser(ReasoningParser):
             tuple[Optional[str], Optional[str]]: Tuple pair containing the
             reasoning content and non-reasoning content.
         """
-        re_match = self.reasoning_regex.findall(model_output)
-        if not re_match:
+        re_match = _REASONING_REGEX.search(model_output)
+        if re_match is None:
             return None, model_output
-        reasoning_content, response_content = re_match[0]
+        reasoning_content, response_content = re_match.groups()
         if not response_content:
             return reasoning_content, None
         return reasoning_content, response_content
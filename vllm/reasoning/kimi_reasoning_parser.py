@@ -8,23 +8,71 @@ from transformers import PreTrainedTokenizerBase
 
 from vllm.entrypoints.openai.protocol import (ChatCompletionRequest,
                                               DeltaMessage)
-from vllm.logger import init_logger
-from vllm.reasoning import ReasoningParser, ReasoningParserManager
+from vllm.reasoning import ReasoningParser
 
-logger = init_logger(__name__)
+STATE_INITIAL = 0
+STATE_REASONING = 1
+STATE_OUTPUT = 2
+
+START_TEXT = "◁think▷"
+START_TEXT_LENGTH = len(START_TEXT)
+
+END_TEXT = "◁/think▷"
+END_TEXT_LENGTH = len(END_TEXT)
+END_TEXT_LEAD = END_TEXT[0]
+
+
+def _end_overlap(text: str, start: int = 0) -> int:
+    # Length of the longest suffix of text[start:] that is a proper prefix of
+    # END_TEXT. '◁' only appears at the start of END_TEXT, so such a suffix can
+    # only begin at the last '◁' within the final END_TEXT_LENGTH - 1
+    # characters.
+    lead_index = text.rfind(END_TEXT_LEAD,
+                            max(len(text) - END_TEXT_LENGTH + 1, start))
+    if lead_index != -1 and END_TEXT.startswith(text[lead_index:]):
+        return len(text) - lead_index
+    return 0
+
+
+def _scan_end(text: str, start: int = 0) -> tuple[int, int]:
+    # Single scan of a reasoning delta, from start on, for the end tag. Returns
+    # the index of END_TEXT (or -1) and, when it's absent, how many trailing
+    # characters could still be the start of an END_TEXT split across deltas.
+    lead_index = text.find(END_TEXT_LEAD, start)
+    if lead_index == -1:
+        # '◁' is outside latin-1, so for the common ASCII-only delta CPython
+        # answers this from the string's storage kind without looking at the
+        # characters, and neither search below can match.
+        return -1, 0
+    # The end tag can't start before its first character, so pick the scan
+    # up from there instead of searching the delta again from the start.
+    index = text.find(END_TEXT, lead_index)
+    if index != -1:
+        return index, 0
+    return -1, _end_overlap(text, lead_index)
 
 
-@ReasoningParserManager.register_module("kimi")
 class KimiReasoningParser(ReasoningParser):
     """
     Reasoning parser for Kimi model.
 
     The Kimi model uses ◁think▷...◁/think▷ tokens to denote reasoning
     text. This parser extracts the reasoning content from the model output.
+
+    Kimi dev is loosey goosey with think tags and can send multiple,
+    mismatched, or malformed tags. This parser is designed to be "best effort"
+    and never fail, regardless of what the model outputs.
+
+    Subclasses only differ in `strict_start`, which decides how streamed
+    output that doesn't start with ◁think▷ is treated.
     """
 
-    start_token: str = "◁think▷"
-    end_token: str = "◁/think▷"
+    start_token: str = START_TEXT
+    end_token: str = END_TEXT
+
+    # If True, streamed output has to start with ◁think▷ to contain any
+    # reasoning. If False, everything up to a bare ◁/think▷ is reasoning.
+    strict_start: bool = False
 
     def __init__(self, tokenizer: PreTrainedTokenizerBase):
         super().__init__(tokenizer)
@@ -34,6 +82,13 @@ class KimiReasoningParser(ReasoningParser):
                 "The model tokenizer must be passed to the ReasoningParser "
                 "constructor during construction.")
 
+        self._state = STATE_INITIAL
+        # Number of characters of a possible tag held back from the previous
+        # delta. The held text is always a prefix of the tag we're waiting for
+        # (START_TEXT in STATE_INITIAL, END_TEXT in STATE_REASONING), so the
+        # match length is all the state we need.
+        self._partial_length = 0
+
     def is_reasoning_end(self, input_ids: list[int]) -> bool:
         # Text-based parser doesn't use token IDs for reasoning detection
         return False
@@ -45,6 +100,46 @@ class KimiReasoningParser(ReasoningParser):
         # Text-based parser returns all input_ids as content
         return input_ids
 
+    def extract_reasoning_content(
+            self, model_output: str, request: ChatCompletionRequest
+    ) -> tuple[Optional[str], Optional[str]]:
+        """
+        Extract reasoning content from the model output.
+
+        If the text starts with ◁think▷, everything up to the first ◁/think▷
+        is reasoning and the rest is content. Otherwise everything is
+        content, even if think tags appear later:
+
+        - "◁think▷a◁/think▷b" → ("a", "b")
+        - "◁think▷a" → ("a", None)
+        - "◁think▷◁/think▷b" → (None, "b")
+        - "◁think▷a◁/think▷" → ("a", None)
+        - "◁think▷a◁think▷b◁/think▷c" → ("a◁think▷b", "c")
+        - "◁think▷a◁/think▷b◁/think▷c" → ("a", "b◁/think▷c")
+        - "x◁think▷a◁/think▷b" → (None, "x◁think▷a◁/think▷b")
+        - "◁/think▷a" → (None, "◁/think▷a")
+
+        Returns:
+            tuple[Optional[str], Optional[str]]: reasoning content and content
+        """
+        # Branches are ordered by how common the layouts are, and the output is
+        # only sliced for the parts that are returned.
+        if model_output.startswith(START_TEXT):
+            reasoning_done_index = model_output.find(END_TEXT,
+                                                     START_TEXT_LENGTH)
+            if reasoning_done_index != -1:
+                # Well-formed: ◁think▷...◁/think▷...
+                reasoning_content = model_output[
+                    START_TEXT_LENGTH:reasoning_done_index]
+                content = model_output[reasoning_done_index + END_TEXT_LENGTH:]
+                return reasoning_content or None, content or None
+
+            # Truncated before ◁/think▷, everything is reasoning
+            return model_output[START_TEXT_LENGTH:], None
+
+        # No reasoning at all, e.g. tool call output
+        return None, model_output
+
     def extract_reasoning_content_streaming(
         self,
         previous_text: str,
@@ -60,106 +155,111 @@ class KimiReasoningParser(ReasoningParser):
         For text ◁think▷abc◁/think▷xyz:
         - 'abc' goes to reasoning_content
         - 'xyz' goes to content
+
+        Only delta_text is scanned; previous_text is never searched again.
+        Text that could be the beginning of a tag split across deltas is
+        held back until the next delta arrives, or until
+        `finish_reasoning_content_streaming` is called at the end of the stream.
+
+        Every field of the returned DeltaMessage is a str slice (or None)
+        produced here, so messages are built with `model_construct` to skip
+        pydantic validation on each delta.
         """
-        # Check if ◁think▷ is present in previous or delta text
-        if self.start_token in previous_text:
-            if self.end_token in delta_text:
-                # ◁think▷ in previous, ◁/think▷ in delta,
-                # extract reasoning content
-                end_index = delta_text.find(self.end_token)
-                reasoning_content = delta_text[:end_index]
-                content = delta_text[end_index + len(self.end_token):]
-                return DeltaMessage(
-                    reasoning_content=reasoning_content,
-                    content=content if content else None,
-                )
-            elif self.end_token in previous_text:
-                # ◁think▷ in previous, ◁/think▷ in previous,
-                # reasoning content continues
-                return DeltaMessage(content=delta_text)
-            else:
-                # ◁think▷ in previous, no ◁/think▷ in previous or delta,
-                # reasoning content continues
-                return DeltaMessage(reasoning_content=delta_text)
-        elif self.start_token in delta_text:
-            if self.end_token in delta_text:
-                # ◁think▷ in delta, ◁/think▷ in delta, extract reasoning content
-                start_index = delta_text.find(self.start_token)
-                end_index = delta_text.find(self.end_token)
-                reasoning_content = delta_text[start_index +
-                                               len(self.start_token):end_index]
-                content = delta_text[end_index + len(self.end_token):]
-                return DeltaMessage(
-                    reasoning_content=reasoning_content,
-                    content=content if content else None,
-                )
-            else:
-                # ◁think▷ in delta, no ◁/think▷ in delta,
-                # reasoning content continues
-                return DeltaMessage(reasoning_content=delta_text)
-        else:
-            # No ◁think▷ in previous or delta, also need to check for ◁/think▷.
-            # Because the model may have generated ◁/think▷ without ◁think▷
-            if self.end_token in delta_text:
-                # ◁/think▷ in delta with more tokens,
-                # extract reasoning content and content
-                end_index = delta_text.find(self.end_token)
-                reasoning_content = delta_text[:end_index]
-                content = delta_text[end_index + len(self.end_token):]
-                return DeltaMessage(
-                    reasoning_content=reasoning_content,
-                    content=content if content else None,
-                )
-            elif self.end_token in previous_text:
-                # ◁/think▷ in previous, thinking content ends
-                return DeltaMessage(content=delta_text)
+        # Parser state is read into locals once and only written back when it
+        # changes.
+        state = self._state
+        if state == STATE_OUTPUT:
+            # Once reasoning is over nothing is ever held back, so the rest of
+            # the stream is passed through as is.
+            return DeltaMessage.model_construct(content=delta_text or None)
+
+        delta = delta_text
+        partial_length = self._partial_length
+        if partial_length:
+            tag = START_TEXT if state == STATE_INITIAL else END_TEXT
+            delta = tag[:partial_length] + delta
+            self._partial_length = 0
+
+        # Tags are skipped by moving offset instead of slicing them off, so
+        # delta is only copied for the parts that end up in the DeltaMessage.
+        offset = 0
+
+        if state == STATE_INITIAL:
+            if delta.startswith(START_TEXT):
+                state = STATE_REASONING
+                offset = START_TEXT_LENGTH
+            elif (len(delta) < START_TEXT_LENGTH
+                  and START_TEXT.startswith(delta)):
+                # May still be the start tag at the beginning of the
+                # response. Save state and wait for more data.
+                self._partial_length = len(delta)
+                return None
+            elif self.strict_start:
+                state = STATE_OUTPUT
             else:
-                # no ◁/think▷ in previous or delta, reasoning content continues
-                return DeltaMessage(reasoning_content=delta_text)
+                # No ◁think▷ at the start, but the model may still generate
+                # ◁/think▷ without ◁think▷, so treat this as reasoning
+                state = STATE_REASONING
+            self._state = state
 
-    def extract_reasoning_content(
-            self, model_output: str, request: ChatCompletionRequest
-    ) -> tuple[Optional[str], Optional[str]]:
-        """
-        Extract reasoning content from the model output.
+        # If we get here, we're either in STATE_REASONING or just switched to
+        # STATE_OUTPUT
+        reasoning_delta = None
+        if state == STATE_REASONING:
+            reasoning_done_index, overlap = _scan_end(delta, offset)
+            if reasoning_done_index == -1:
+                # If the end of our current text may be the start of the end
+                # tag, hold it back until we know. Otherwise it can't possibly
+                # be part of the end tag, so return everything.
+                self._partial_length = overlap
+                return DeltaMessage.model_construct(
+                    reasoning_content=delta[offset:len(delta) - overlap])
 
-        For text ◁think▷abc◁/think▷xyz:
-        - 'abc' goes to reasoning_content
-        - 'xyz' goes to content
+            self._state = STATE_OUTPUT
+            reasoning_delta = delta[offset:reasoning_done_index]
+            offset = reasoning_done_index + END_TEXT_LENGTH
 
-        Returns:
-            tuple[Optional[str], Optional[str]]: reasoning content and content
+        # If we get here, we're definitely in STATE_OUTPUT
+        return DeltaMessage.model_construct(reasoning_content=reasoning_delta,
+                                            content=delta[offset:] or None)
+
+    def finish_reasoning_content_streaming(self) -> Union[DeltaMessage, None]:
+        """
+        Return the partial tag still held back when the stream ends. It never
+        turned into a tag, so it's emitted the way any other text would have
+        been in the current state.
         """
+        partial_length = self._partial_length
+        if not partial_length:
+            return None
+        self._partial_length = 0
 
-        # Kimi dev is loosey goosey with think tags and can send multiple,
-        # mismatched, or malformed tags. This parser is designed to be "best effort"
-        # and never fail, regardless of what the model outputs.
-        #
-        # Strategy:
-        # 1. If text starts with ◁think▷: Extract everything up to first ◁/think▷ 
-        #    as reasoning, rest as content
-        # 2. If text doesn't start with ◁think▷: Everything goes to content, 
-        #    even if think tags appear later
-        # 3. Never fail regardless of malformed/multiple/mismatched tags
-        #
-        # This ensures vLLM won't crash with poorly behaved models while still
-        # correctly handling the common case.
-        
-        # Check if the output starts with the start token
-        if not model_output.startswith(self.start_token):
-            # If no start token at beginning, treat everything as content, not reasoning
-            return None, model_output
-        
-        # Remove the start token from the output
-        model_output_without_start = model_output[len(self.start_token):]
-
-        # Look for the end token
-        if self.end_token not in model_output_without_start:
-            # If we have start token but no end token, treat everything as reasoning
-            return model_output_without_start, None
+        if self._state == STATE_INITIAL:
+            held = START_TEXT[:partial_length]
+            if self.strict_start:
+                self._state = STATE_OUTPUT
+                return DeltaMessage.model_construct(content=held)
+            self._state = STATE_REASONING
         else:
-            reasoning_content, _, content = model_output_without_start.partition(
-                self.end_token)
-            # If generation stops right after end-of-think, return null content
-            final_content = content or None
-            return reasoning_content, final_content
\ No newline at end of file
+            held = END_TEXT[:partial_length]
+        return DeltaMessage.model_construct(reasoning_content=held)
+
+
+class Kimi2ReasoningParser(KimiReasoningParser):
+    """
+    Reasoning parser for Kimi model, registered as "kimi2".
+
+    Behaves exactly like `KimiReasoningParser`; kept as its own name so
+    existing `--reasoning-parser kimi2` deployments keep working.
+    """
+
+
+class Kimi3ReasoningParser(KimiReasoningParser):
+    """
+    Reasoning parser for Kimi model with strict start tag handling.
+
+    Streamed output only contains reasoning if it starts with ◁think▷, which
+    matches how non-streaming output is parsed.
+    """
+
+    strict_start = True